@@ -1,18 +1,25 @@
 import requests
-from typing import Optional, Dict, Any
+from requests.adapters import HTTPAdapter
+from typing import Optional, Dict, Any, Tuple, Union
+from urllib3.util.retry import Retry
 from utils.logger import logger
 
 
 class SessionManager:
     """统一的会话管理器"""
 
-    def __init__(self, timeout: int = 30):
+    def __init__(
+        self,
+        timeout: Union[float, Tuple[float, float]] = 30,
+        session: Optional[requests.Session] = None,
+    ):
         """初始化会话管理器
 
         Args:
-            timeout (int): 请求超时时间，默认30秒
+            timeout (float | tuple): 请求超时时间，默认30秒，也可传入(连接超时, 读取超时)
+            session (requests.Session, optional): 共享的会话实例，不传则懒加载创建
         """
-        self._session = None
+        self._session = session
         self.timeout = timeout
         self.default_headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/137.0.0.0 Safari/537.36"
@@ -24,6 +31,23 @@ class SessionManager:
         if self._session is None:
             self._session = requests.Session()
             self._session.headers.update(self.default_headers)
+            # 挂载连接池，同一主机的多次请求复用keep-alive连接；
+            # GET请求在连接失败或网关错误时退避重试，重试用尽后仍返回最后的响应
+            retries = Retry(
+                total=3,
+                backoff_factor=0.2,
+                status_forcelist=(502, 503, 504),
+                allowed_methods=frozenset(["GET"]),
+                raise_on_status=False,
+            )
+            adapter = HTTPAdapter(
+                pool_connections=4,
+                pool_maxsize=16,
+                pool_block=False,
+                max_retries=retries,
+            )
+            self._session.mount("http://", adapter)
+            self._session.mount("https://", adapter)
         return self._session
 
     def get(
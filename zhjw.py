@@ -0,0 +1,281 @@
+import hashlib
+import time
+from urllib.parse import urlparse
+from core.get_ids_token import QfnuAuthClient
+from utils.logger import logger
+from utils.session_manager import SessionManager
+
+# 页面均按UTF-8字节匹配，省去解码整个页面
+# 登录成功的页面标识（页面标题、个人中心、菜单项）
+_LOGIN_MARKERS = tuple(
+    marker.encode("utf-8")
+    for marker in ("教学一体化服务平台", "个人中心", "我的桌面", "学籍成绩")
+)
+# 姓名所在标签及姓名中不应出现的内容（排除"退出"）
+_NAME_OPEN_TAG = b'<span class="glyphicon-class">'
+_NAME_CLOSE_TAG = b"</span>"
+_NAME_EXCLUDED = tuple(c.encode("utf-8") for c in "<退出")
+# 登录失败页面的标识，与登录成功标识以页面中最先出现者为准；完整页面短于最小字节数时视为错误页
+_FAILURE_MARKERS = tuple(
+    marker.encode("utf-8") for marker in ("用户登录", "登录失败")
+)
+_MIN_PAGE_LENGTH = 512
+# 判定后继续读取的最大字节数，读完的响应可将连接归还连接池
+_DRAIN_LIMIT = 64 * 1024
+# 教务系统请求超时时间（连接超时, 读取超时）
+_TIMEOUT = (3.05, 10)
+# 登录成功后复用统一认证会话的有效期（秒）
+_AUTH_CACHE_TTL = 30
+
+
+class ZhjwClient:
+    """曲阜师范大学教务系统客户端"""
+
+    # 更完整的浏览器请求头，所有实例共用
+    _DEFAULT_HEADERS = {
+        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/137.0.0.0 Safari/537.36",
+        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7",
+        "Accept-Language": "zh-CN,zh;q=0.9,en-US;q=0.8,en;q=0.7",
+        "Accept-Encoding": "gzip, deflate",
+        "Connection": "keep-alive",
+        "Upgrade-Insecure-Requests": "1",
+        "Cache-Control": "no-cache",
+        "Pragma": "no-cache",
+    }
+
+    def __init__(self):
+        self._auth_client = None
+        self._session = None
+        self.base_url = "http://zhjw.qfnu.edu.cn"
+        # 最近一次登录成功的(账号密码哈希, 时间)，会话中的统一认证Cookie只属于该账号
+        self._last_auth = None
+
+    @property
+    def auth_client(self) -> QfnuAuthClient:
+        """获取统一认证客户端，懒加载模式"""
+        if self._auth_client is None:
+            self._auth_client = QfnuAuthClient()
+            # 设置请求头，连接池由SessionManager在创建会话时挂载
+            self._auth_client.session.headers.update(self._DEFAULT_HEADERS)
+        return self._auth_client
+
+    @property
+    def session(self) -> SessionManager:
+        """获取教务系统会话管理器，懒加载模式"""
+        if self._session is None:
+            # 与认证客户端共享同一个requests.Session，复用Cookie和连接池
+            self._session = SessionManager(
+                timeout=_TIMEOUT, session=self.auth_client.session
+            )
+        return self._session
+
+    def login(self, username, password):
+        """登录教务系统"""
+        target_url = "http://ids.qfnu.edu.cn/authserver/login?service=http://zhjw.qfnu.edu.cn/sso.jsp"
+
+        auth_key = hashlib.blake2b(
+            f"{username}:{password}".encode(), digest_size=16
+        ).hexdigest()
+
+        # 同一账号短时间内重复登录时，先尝试用已有的统一认证会话直接换取新ticket
+        if self._last_auth is not None:
+            last_key, last_at = self._last_auth
+            if (
+                last_key == auth_key
+                and time.monotonic() - last_at < _AUTH_CACHE_TTL
+            ):
+                redirect_url = self._get_cached_redir_uri(target_url)
+                if redirect_url and self._complete_sso_login(redirect_url):
+                    self._last_auth = (auth_key, time.monotonic())
+                    return True
+                logger.info("复用认证会话失败，重新进行完整登录")
+        self._last_auth = None
+
+        logger.info("正在获取认证重定向URL...")
+
+        # 第一步：获取认证重定向URL
+        redirect_url = self.auth_client.get_redir_uri(
+            username=username, password=password, redir_uri=target_url
+        )
+
+        if not redirect_url:
+            logger.error("获取认证重定向URL失败")
+            return False
+
+        logger.info(f"获取到重定向URL：{redirect_url}")
+
+        # 第二步：访问重定向URL完成SSO登录
+        if self._complete_sso_login(redirect_url):
+            self._last_auth = (auth_key, time.monotonic())
+            return True
+        return False
+
+    def _get_cached_redir_uri(self, target_url):
+        """利用会话中已有的统一认证Cookie获取新的重定向URL
+
+        ticket只能使用一次，因此不缓存重定向URL本身，而是重新请求认证地址，
+        已登录时统一认证会直接返回带新ticket的链接，省去获取盐值和提交密码的请求
+
+        Args:
+            target_url (str): 统一认证登录地址
+
+        Returns:
+            str: 带有ticket的链接，失败时返回None
+        """
+        try:
+            response = self.session.get(target_url, allow_redirects=False)
+        except Exception as e:
+            logger.error(f"复用认证会话失败：{e}")
+            return None
+
+        location = response.headers.get("Location")
+        if location and "ticket=" in location:
+            logger.info("已复用统一认证会话获取重定向URL")
+            return location
+        return None
+
+    def _complete_sso_login(self, redirect_url):
+        """完成SSO登录流程"""
+        try:
+            # 访问重定向URL（包含ticket）
+            response = self.session.get(redirect_url, allow_redirects=True)
+
+            logger.info(f"访问重定向URL状态码：{response.status_code}")
+            logger.debug("访问重定向URL响应头：%s", response.headers)
+
+            # ticket链接本身指向sso.jsp，只有其后的跳转再次到达sso.jsp，
+            # 才说明ticket已兑换完成、Cookie已写入，无需再次访问；
+            # 否则显式访问sso.jsp兜底
+            hop_urls = [r.url for r in response.history[1:]]
+            if response.history:
+                hop_urls.append(response.url)
+            if any(urlparse(url).path.endswith("/sso.jsp") for url in hop_urls):
+                logger.info("重定向已经过sso.jsp，跳过SSO重定向URL访问")
+            else:
+                logger.info("正在访问SSO重定向URL...")
+                sso_url = "http://zhjw.qfnu.edu.cn/sso.jsp"
+                response = self.session.get(sso_url, allow_redirects=True)
+
+                logger.info(f"访问sso.jsp状态码：{response.status_code}")
+                logger.debug("访问sso.jsp响应头：%s", response.headers)
+
+            # 访问教务首页
+            # 注意：xsMain.jsp依赖sso.jsp写入的jsxsd会话Cookie，必须在其之后串行请求，
+            # 依靠共享会话的keep-alive连接减少开销
+            main_url = "http://zhjw.qfnu.edu.cn/jsxsd/framework/xsMain.jsp"
+            response = self.session.get(main_url, allow_redirects=True, stream=True)
+            logger.info(f"访问教务首页状态码：{response.status_code}")
+            logger.debug("访问教务首页响应头：%s", response.headers)
+
+            if self._check_login_success(response):
+                logger.info("教务系统登录成功！")
+                return True
+            else:
+                logger.error("教务系统登录失败！")
+                return False
+
+        except Exception as e:
+            logger.error(f"SSO登录过程中发生错误：{e}")
+            return False
+
+    def _read_until_login_marker(self, response, chunk_size=4096):
+        """流式读取响应内容，找出页面中最先出现的登录成功或失败标识
+
+        成功与失败标识在同一滑动窗口中查找，判定结果与服务器的分块方式无关；
+        判定后继续读取不超过_DRAIN_LIMIT字节，使读完的连接归还连接池
+
+        Args:
+            response (requests.Response): 以stream=True发起请求得到的响应
+            chunk_size (int): 每次读取的字节数
+
+        Returns:
+            tuple: (最先出现的标识, 页面内容, 已读取的总字节数)，
+                未找到标识时标识为None，页面内容为完整页面
+        """
+        markers = _LOGIN_MARKERS + _FAILURE_MARKERS
+        # 与上一块重叠的长度，防止标识被切分在两块之间
+        overlap = max(len(marker) for marker in markers) - 1
+        chunks = []
+        total = 0
+        drained = 0
+        first_marker = None
+        tail = b""
+        try:
+            for chunk in response.iter_content(chunk_size=chunk_size):
+                total += len(chunk)
+                if first_marker is not None:
+                    drained += len(chunk)
+                    if drained > _DRAIN_LIMIT:
+                        break
+                    continue
+
+                chunks.append(chunk)
+                window = tail + chunk
+                hits = [
+                    (window.find(marker), marker)
+                    for marker in markers
+                    if marker in window
+                ]
+                if hits:
+                    first_marker = min(hits)[1]
+                else:
+                    tail = window[-overlap:]
+        finally:
+            # 超出_DRAIN_LIMIT未读完时，关闭响应会丢弃连接而不是归还连接池
+            response.close()
+
+        return first_marker, b"".join(chunks), total
+
+    def _check_login_success(self, response):
+        """检查登录是否成功
+
+        Args:
+            response (requests.Response): 以stream=True请求教务首页得到的响应
+
+        Returns:
+            bool: 是否登录成功
+        """
+        marker, html_content, total = self._read_until_login_marker(response)
+
+        # 未读完的页面至少已读取_DRAIN_LIMIT字节，过短时一定是完整页面
+        if total < _MIN_PAGE_LENGTH:
+            logger.error("返回的页面过短，可能为错误页")
+            return False
+
+        if marker in _FAILURE_MARKERS:
+            logger.error("返回的页面为登录页或错误页")
+            return False
+
+        # 查找学生姓名或其他登录成功的标识
+        if marker is not None:
+            logger.info(f"登录验证成功，匹配到：{marker.decode('utf-8')}")
+            return True
+
+        name = self._find_student_name(html_content)
+        if name:
+            logger.info(f"登录验证成功，匹配到姓名：{name}")
+            return True
+
+        logger.error("未找到登录成功的标识")
+        return False
+
+    def _find_student_name(self, html_content):
+        """查找页面中的学生姓名
+
+        Args:
+            html_content (bytes): 页面内容（UTF-8编码）
+
+        Returns:
+            str: 学生姓名，未找到时返回None
+        """
+        start = html_content.find(_NAME_OPEN_TAG)
+        while start != -1:
+            start += len(_NAME_OPEN_TAG)
+            end = html_content.find(_NAME_CLOSE_TAG, start)
+            if end == -1:
+                break
+            name = html_content[start:end]
+            if name and not any(c in name for c in _NAME_EXCLUDED):
+                return name.decode("utf-8", errors="replace")
+            start = html_content.find(_NAME_OPEN_TAG, end)
+        return None